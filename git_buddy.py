@@ -7,32 +7,338 @@ A simple tool to push files to GitHub repositories with terminal interface
 import os
 import sys
 import subprocess
+import shlex
 import re
+import configparser
+import asyncio
+import queue
+import threading
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
 import json
 
 try:
     from rich.console import Console
     from rich.prompt import Prompt, Confirm
-    from rich.table import Table
-    from rich.panel import Panel
     from rich.text import Text
-    from rich.progress import Progress, SpinnerColumn, TextColumn
 except ImportError:
     print("Error: Required packages not installed. Please run: pip install rich")
     sys.exit(1)
 
+# Table, Panel and Progress are imported lazily inside the methods that
+# use them — rich.progress in particular drags in live-display and
+# threading machinery that would otherwise slow down every CLI launch.
+
+# pathspec (declared in requirements.txt) drives .gitignore-aware
+# pruning of the walk; the guard keeps a bare download of this file
+# working without it, just without the pruning.
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
 console = Console()
 
+# Directories pruned during traversal (never descended into) and file
+# suffixes skipped per entry.  Hidden names are filtered separately.
+IGNORE_DIRS = frozenset({'.git', '__pycache__', 'node_modules', 'venv'})
+IGNORE_SUFFIXES = ('.pyc', '.pyo', '.egg-info')
+
+# Budgets for the filesystem walk so a pathological tree (huge vendored
+# caches, symlink-free but enormous monorepos) can't hang or exhaust
+# memory before the picker is even shown.
+MAX_SCAN_FILES = 10_000
+MAX_SCAN_DEPTH = 12
+
+# git emits progress updates as \r-terminated overwrites on stderr;
+# split streamed chunks on either terminator so they surface live.
+_LINE_BREAK_RE = re.compile(rb'\r\n|\r|\n')
+
+# Known git push failures as one compiled alternation: a single scan
+# per streamed line classifies the error via the matching group's name,
+# replacing a dozen separate substring searches over the output.
+_PUSH_ERROR_RE = re.compile(
+    r'(?P<not_found>repository not found|repository does not exist)'
+    r'|(?P<password_removed>support for password authentication was removed)'
+    r'|(?P<auth>permission denied|authentication failed|access denied)'
+    r'|(?P<conflict>failed to push some refs|non-fast-forward|updates were rejected|rejected)'
+    r"|(?P<no_remote_ref>couldn't find remote ref)",
+    re.IGNORECASE
+)
+
+# Two-character porcelain status codes mapped straight to their bucket
+# ('M'odified / 'N'ew / 'D'eleted): one dict lookup per line instead of
+# a strip() plus a cascade of list-membership tests.
+_STATUS_MAP = {
+    ' M': 'M', 'M ': 'M', 'MM': 'M', 'AM': 'M', 'MA': 'M', 'AA': 'M',
+    'A ': 'N', ' A': 'N', '??': 'N',
+    ' D': 'D', 'D ': 'D', 'AD': 'D', 'MD': 'D',
+}
+
+# Accepted GitHub URL shapes, compiled once at import time. The https
+# form uses a non-greedy repo group so an optional trailing '.git' (and
+# slash) is actually stripped rather than swallowed by the repo name.
+# Selection tokens: a bare index or an inclusive range like "100-200"
+_SELECTION_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+_GH_URL_PATTERNS = [
+    re.compile(r'^https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$'),
+    re.compile(r'^git@github\.com:([^/]+)/([^/]+?)\.git$'),
+    re.compile(r'^([^/]+)/([^/]+)$')  # Just owner/repo
+]
+
+
+class FileInfo(NamedTuple):
+    """Lightweight record for a file discovered during the scan
+
+    The absolute path, the path relative to the working directory and
+    the file size are all computed once during traversal so downstream
+    consumers never re-derive them (no repeated relative_to or stat).
+    """
+    abspath: str
+    relpath: str
+    size: int
+
+
+def _shell_join(argv: List[str]) -> str:
+    """Quote an argv list into a single shell-safe command string"""
+    return ' '.join(shlex.quote(arg) for arg in argv)
+
+
+# readdir latency, not CPU, bounds the walk; a handful of threads is
+# enough to keep several directory reads in flight without oversubscribing.
+_WALK_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
+def _scan_one_dir(path, depth, spec, base, files, subdirs):
+    """Scan one directory, collecting kept files and subdirs to descend.
+
+    Uses os.scandir so that is_file()/is_dir()/stat() reuse the cached
+    directory-entry data instead of issuing a fresh stat() per file.
+    Hidden entries and common junk directories are pruned here at the
+    directory level, so ignored subtrees are never descended into.
+    Descent stops at MAX_SCAN_DEPTH levels. When a compiled .gitignore
+    spec is supplied (with base, the root prefix to strip), matching
+    directories are pruned before descent and matching files skipped.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in IGNORE_DIRS or entry.name.endswith(IGNORE_SUFFIXES):
+                    continue
+                if depth + 1 > MAX_SCAN_DEPTH:
+                    continue
+                if spec is not None and spec.match_file(entry.path[len(base):] + '/'):
+                    continue
+                subdirs.append((entry.path, depth + 1))
+            elif entry.is_file(follow_symlinks=False):
+                if entry.name.endswith(IGNORE_SUFFIXES):
+                    continue
+                if spec is not None and spec.match_file(entry.path[len(base):]):
+                    continue
+                files.append(entry)
+
+
+def _walk_parallel(root, spec=None, base=None):
+    """List file DirEntry objects under root with a small thread pool.
+
+    Each worker pops a directory off a shared queue, scans it with
+    _scan_one_dir into its own bucket (no lock on the hot path) and
+    pushes subdirectories back for whichever worker is free next. The
+    GIL is released during scandir/stat syscalls, so on latency-bound
+    filesystems several directory reads proceed concurrently.
+
+    The MAX_SCAN_FILES budget is enforced inside the workers: a shared
+    counter (one lock acquisition per directory, not per file) trips a
+    stop event once the budget is exceeded, after which queued
+    directories are drained unscanned — a pathological tree is never
+    enumerated whole just to be truncated afterwards.
+    """
+    pending = queue.Queue()
+    pending.put((str(root), 0))
+    buckets = []
+    threads = []
+    stop = threading.Event()
+    count_lock = threading.Lock()
+    counted = [0]
+
+    def worker(bucket):
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            if stop.is_set():
+                pending.task_done()
+                continue
+            path, depth = item
+            subdirs = []
+            found = []
+            try:
+                _scan_one_dir(path, depth, spec, base, found, subdirs)
+            except OSError:
+                pass  # directory vanished mid-walk; skip it
+            finally:
+                bucket.extend(found)
+                with count_lock:
+                    counted[0] += len(found)
+                    if counted[0] > MAX_SCAN_FILES:
+                        stop.set()
+                if not stop.is_set():
+                    for sub in subdirs:
+                        pending.put(sub)
+                pending.task_done()
+
+    for _ in range(_WALK_WORKERS):
+        bucket = []
+        buckets.append(bucket)
+        thread = threading.Thread(target=worker, args=(bucket,), daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    # Every queued directory is matched by a task_done, so join returns
+    # once the whole tree has been scanned; then wake and reap workers.
+    pending.join()
+    for _ in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+
+    files = []
+    for bucket in buckets:
+        files.extend(bucket)
+    return files
+
+
 class GitBuddy:
     def __init__(self):
         self.console = console
         self.current_dir = Path.cwd()
-        
+        # Base prefix cached as a string so relativizing a path is a
+        # slice instead of a PurePath parse.
+        self._base_str = str(self.current_dir) + os.sep
+        # Filled by _prefetch_repo_state so later lookups skip a spawn
+        self._branch_cache: Optional[str] = None
+        self._status_raw: Optional[str] = None
+        # Parsed status, reused across the interactive flow until a
+        # mutating git operation invalidates it
+        self._status_cache: Optional[Tuple[List[str], List[str], List[str]]] = None
+        # Untracked ('??') paths from the last status parse, so
+        # show_file_diff can branch without re-shelling per file
+        self._new_files_set: set = set()
+        # Memoized working-directory listing, dropped with the status
+        # caches whenever the tree may have changed
+        self._files_cache: Optional[List[FileInfo]] = None
+        # Lazily probed "is this a git repo?" flag, set True on init
+        self._is_git_repo: Optional[bool] = None
+        # Compiled .gitignore spec keyed by the file's mtime
+        self._gitignore_cache: Optional[Tuple[float, object]] = None
+        # Number of files add_files_to_git staged in this iteration;
+        # lets commit_changes skip re-probing the tree it just changed
+        self._staged_count = 0
+
+    def _load_gitignore_spec(self):
+        """Compile the top-level .gitignore for pruning the walk
+
+        Only the root .gitignore is consulted (shallow policy — nested
+        ones are git's job once a repository exists), and the compiled
+        spec is cached keyed on the file's mtime so repeated scans reuse
+        it. Returns None when pathspec isn't installed or there is no
+        .gitignore to read.
+        """
+        if pathspec is None:
+            return None
+
+        gitignore = self.current_dir / '.gitignore'
+        try:
+            mtime = gitignore.stat().st_mtime
+        except OSError:
+            return None
+
+        if self._gitignore_cache is not None and self._gitignore_cache[0] == mtime:
+            return self._gitignore_cache[1]
+
+        try:
+            with open(gitignore, 'r', encoding='utf-8', errors='replace') as f:
+                spec = pathspec.PathSpec.from_lines('gitwildmatch', f)
+        except (OSError, ValueError):
+            return None
+        self._gitignore_cache = (mtime, spec)
+        return spec
+
+    def _in_git_repo(self) -> bool:
+        """Whether current_dir holds a git repository, probed once
+
+        The .git stat is cached so repeated checks in the interactive
+        flow cost nothing (stat latency matters on network mounts);
+        initialize_git_repo flips the flag when it creates the repo.
+        """
+        if self._is_git_repo is None:
+            self._is_git_repo = (self.current_dir / '.git').exists()
+        return self._is_git_repo
+
+    def _invalidate_status(self):
+        """Drop cached status after a mutating git operation"""
+        self._status_cache = None
+        self._status_raw = None
+        self._new_files_set = set()
+        self._files_cache = None
+
+    def _rel(self, path: str) -> str:
+        """Relativize a path under current_dir via plain string slicing
+
+        Always returns forward-slash separators so git gets
+        pre-normalized pathspecs on every platform (git ls-files output
+        is already in this form).
+        """
+        if path.startswith(self._base_str):
+            rel = path[len(self._base_str):]
+        else:
+            rel = os.path.relpath(path, self._base_str[:-1])
+        return rel.replace(os.sep, '/') if os.sep != '/' else rel
+
+    async def _git_async(self, argv: List[str]) -> Tuple[bool, str]:
+        """Async variant of run_git_command for concurrent probes"""
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=str(self.current_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        return proc.returncode == 0, (stdout + stderr).decode('utf-8', 'replace')
+
+    def _prefetch_repo_state(self):
+        """Run the independent status and branch probes concurrently
+
+        'git status --porcelain' and 'git branch --show-current' do not
+        depend on each other, so launching them together costs one
+        subprocess round-trip instead of two. Results land in
+        self._status_raw (consumed once by get_git_status) and
+        self._branch_cache (reused by get_current_branch).
+        """
+        async def _gather():
+            return await asyncio.gather(
+                self._git_async(['git', 'status', '--porcelain', '-z']),
+                self._git_async(['git', 'branch', '--show-current'])
+            )
+
+        try:
+            (status_ok, status_out), (branch_ok, branch_out) = asyncio.run(_gather())
+        except Exception:
+            return
+
+        if status_ok:
+            self._status_raw = status_out
+        if branch_ok and branch_out.strip():
+            self._branch_cache = branch_out.strip()
+
     def display_header(self):
         """Display the application header"""
+        from rich.panel import Panel
+
         header = Panel(
             Text("🚀 Git Buddy - Terminal Git Helper", style="bold blue"),
             subtitle="Push your files to GitHub with ease"
@@ -44,94 +350,180 @@ class GitBuddy:
         if not url:
             return False, "URL cannot be empty"
             
-        # Handle different GitHub URL formats
-        patterns = [
-            r'^https://github\.com/([^/]+)/([^/]+)/?(?:\.git)?$',
-            r'^git@github\.com:([^/]+)/([^/]+)\.git$',
-            r'^([^/]+)/([^/]+)$'  # Just owner/repo
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, url.strip())
+        url = url.strip()
+
+        # Fast path for the most common typed input, bare "owner/repo":
+        # a couple of character checks instead of the regex engine.
+        if url.count('/') == 1 and '@' not in url and ':' not in url and not url.startswith('http'):
+            owner, repo = url.split('/', 1)
+            if repo.endswith('.git'):
+                repo = repo[:-4]
+            if owner and repo:
+                return True, f"https://github.com/{owner}/{repo}.git"
+
+        # Handle the remaining GitHub URL formats (patterns precompiled at module load)
+        for pattern in _GH_URL_PATTERNS:
+            match = pattern.match(url)
             if match:
                 owner, repo = match.groups()
-                repo = repo.replace('.git', '')
+                # Suffix check, not replace(): no scan of the whole name
+                # and no risk of eating a '.git' embedded mid-string
+                if repo.endswith('.git'):
+                    repo = repo[:-4]
                 return True, f"https://github.com/{owner}/{repo}.git"
                 
         return False, "Invalid GitHub URL format. Use: https://github.com/owner/repo or owner/repo"
     
     def get_git_status(self) -> Tuple[List[str], List[str], List[str]]:
         """Get git status and return lists of modified, new, and deleted files"""
-        success, output = self.run_git_command(['git', 'status', '--porcelain'])
+        if self._status_cache is not None:
+            return self._status_cache
+
+        if self._status_raw is not None:
+            # Prefetched concurrently alongside the branch probe
+            success, output = True, self._status_raw
+            self._status_raw = None
+        else:
+            success, output = self.run_git_command(['git', 'status', '--porcelain', '-z'])
         
         modified_files = []
         new_files = []
         deleted_files = []
-        
+        untracked = set()
+        targets = {'M': modified_files, 'N': new_files, 'D': deleted_files}
+
         if success and output:
-            for line in output.strip().split('\n'):
-                if len(line) < 3:
+            # -z gives NUL-terminated records with no quoting, so names
+            # containing spaces, quotes or newlines parse cleanly from a
+            # single split. Rename/copy records are followed by a bare
+            # source-path record that must be consumed alongside them.
+            records = output.split('\0')
+            index = 0
+            while index < len(records):
+                record = records[index]
+                index += 1
+                if len(record) < 4:
                     continue
-                    
-                status_code = line[:2]
-                file_path = line[3:]
-                
-                if status_code.strip() in ['M', 'MM', 'AM']:
-                    modified_files.append(file_path)
-                elif status_code.strip() in ['A', '??', 'AM']:
-                    new_files.append(file_path)
-                elif status_code.strip() in ['D', 'AD', 'MD']:
-                    deleted_files.append(file_path)
-                elif status_code[0] in ['M', 'A', '?'] and status_code[1] in ['M', 'A', '?']:
-                    # Handle staged and unstaged changes
-                    if file_path not in modified_files and file_path not in new_files:
-                        if status_code[0] == '?' or status_code[1] == '?':
-                            new_files.append(file_path)
-                        else:
-                            modified_files.append(file_path)
-        
-        return modified_files, new_files, deleted_files
 
-    def get_files_in_directory(self, directory: Path = None) -> List[Path]:
-        """Get all files in the current directory (excluding git and hidden files)"""
+                code = record[:2]
+                if code[0] in 'RC':
+                    index += 1  # skip the rename/copy source path
+                    continue
+
+                bucket = _STATUS_MAP.get(code)
+                if bucket is None:
+                    continue
+
+                file_path = record[3:]
+                targets[bucket].append(file_path)
+                if code == '??':
+                    untracked.add(file_path)
+
+
+        self._status_cache = (modified_files, new_files, deleted_files)
+        self._new_files_set = untracked
+        return self._status_cache
+
+    def get_files_in_directory(self, directory: Path = None) -> List[FileInfo]:
+        """Get all files in the current directory as FileInfo records
+
+        Sizes come from the scandir entries' cached stat results and
+        relative paths are computed once here, so the file listing never
+        has to stat or re-relativize the same file twice. The listing
+        for the working directory is memoized per run() iteration, so
+        re-entering the picker doesn't repeat the enumeration.
+        """
         if directory is None:
             directory = self.current_dir
-            
+
+        default_dir = directory == self.current_dir
+        if default_dir and self._files_cache is not None:
+            return self._files_cache
+
+        # When a repository exists, git's index already knows every
+        # tracked and untracked-but-not-ignored file; asking it is one
+        # subprocess instead of walking (and stat-ing) the whole tree,
+        # and honors .gitignore for free.
+        in_repo = self._in_git_repo() if default_dir else (directory / '.git').exists()
+        if in_repo:
+            files = self._list_files_from_git(directory)
+            if files is not None:
+                if default_dir:
+                    self._files_cache = files
+                return files
+
+        spec = self._load_gitignore_spec()
+        entries = _walk_parallel(directory, spec=spec, base=str(directory) + os.sep)
+        if len(entries) > MAX_SCAN_FILES:
+            self.console.print(
+                f"[yellow]⚠ Stopped scanning after {MAX_SCAN_FILES} files — "
+                f"narrow the directory to see everything[/yellow]"
+            )
+            del entries[MAX_SCAN_FILES:]
+        files = [
+            FileInfo(
+                entry.path,
+                self._rel(entry.path),
+                entry.stat(follow_symlinks=False).st_size
+            )
+            for entry in entries
+        ]
+        # Not sorted here: the common "push changed files" path never
+        # shows indices, so display_file_selection sorts lazily only
+        # when a numbered listing is actually rendered.
+        if default_dir:
+            self._files_cache = files
+        return files
+
+    def _list_files_from_git(self, directory: Path) -> Optional[List[FileInfo]]:
+        """Enumerate files via git ls-files instead of a filesystem walk
+
+        Uses NUL-separated output so unusual filenames parse cleanly.
+        Returns None when the listing fails (e.g. broken repo) so the
+        caller can fall back to walking the tree.
+        """
+        success, output = self.run_git_command(
+            ['git', 'ls-files', '--cached', '--others', '--exclude-standard', '-z'],
+            cwd=directory
+        )
+        if not success:
+            return None
+
+        base = str(directory)
         files = []
-        ignore_patterns = ['.git', '__pycache__', '.pyc', '.DS_Store', '.egg-info', 'node_modules', '.vscode', '.idea']
-        
-        for item in directory.rglob('*'):
-            if item.is_file():
-                # Skip hidden files, git files, and common ignore patterns
-                relative_path = str(item.relative_to(directory))
-                should_skip = (
-                    any(part.startswith('.') for part in item.parts) or
-                    any(ignore in relative_path for ignore in ignore_patterns)
-                )
-                if not should_skip:
-                    files.append(item)
-        return sorted(files)
-    
-    def get_changed_files_as_paths(self) -> List[Path]:
-        """Get only changed/new files as Path objects"""
+        for rel in output.split('\0'):
+            if not rel:
+                continue
+            abspath = os.path.join(base, rel)
+            try:
+                size = os.lstat(abspath).st_size
+            except OSError:
+                # Still in the index but gone from the working tree
+                continue
+            files.append(FileInfo(abspath, rel, size))
+        return files
+
+    def get_changed_files_as_paths(self) -> List[FileInfo]:
+        """Get only changed/new files as FileInfo records"""
         modified_files, new_files, deleted_files = self.get_git_status()
         all_changed = modified_files + new_files
-        
+
         changed_paths = []
         for file_path in all_changed:
             full_path = self.current_dir / file_path
             if full_path.exists():
-                changed_paths.append(full_path)
-        
-        return sorted(changed_paths)
+                changed_paths.append(FileInfo(str(full_path), file_path, full_path.stat().st_size))
+
+        return sorted(changed_paths, key=lambda info: info.relpath)
     
     def show_file_diff(self, file_path: str):
         """Show diff for a specific file"""
         self.console.print(f"\n[bold]Diff for {file_path}:[/bold]")
         
-        # Check if file is new (untracked)
-        success, status_output = self.run_git_command(['git', 'status', '--porcelain', file_path])
-        if success and status_output.startswith('??'):
+        # Check if file is new (untracked) via the cached status parse —
+        # no per-file git subprocess just to spot a '??' code
+        self.get_git_status()
+        if file_path in self._new_files_set:
             self.console.print("[green]This is a new file (showing first 20 lines):[/green]")
             try:
                 with open(self.current_dir / file_path, 'r', encoding='utf-8') as f:
@@ -143,23 +535,36 @@ class GitBuddy:
             except Exception as e:
                 self.console.print(f"[red]Could not read file: {e}[/red]")
         else:
-            # Show actual diff for modified files
-            success, diff_output = self.run_git_command(['git', 'diff', 'HEAD', '--', file_path])
-            if success and diff_output.strip():
-                # Parse and colorize diff output
-                lines = diff_output.split('\n')
-                for line in lines:
-                    if line.startswith('+++') or line.startswith('---'):
-                        self.console.print(f"[bold]{line}[/bold]")
-                    elif line.startswith('+'):
-                        self.console.print(f"[green]{line}[/green]")
-                    elif line.startswith('-'):
-                        self.console.print(f"[red]{line}[/red]")
-                    elif line.startswith('@@'):
-                        self.console.print(f"[cyan]{line}[/cyan]")
-                    else:
-                        self.console.print(line)
-            else:
+            # Stream the diff for modified files: colorize each line as
+            # git produces it instead of buffering the whole diff into a
+            # string and re-splitting — large diffs start rendering
+            # immediately and never sit in memory twice.
+            process = subprocess.Popen(
+                ['git', 'diff', 'HEAD', '--', file_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.current_dir,
+                text=True,
+                bufsize=1
+            )
+            printed_any = False
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                if not printed_any and not line.strip():
+                    continue
+                printed_any = True
+                if line.startswith('+++') or line.startswith('---'):
+                    self.console.print(f"[bold]{line}[/bold]")
+                elif line.startswith('+'):
+                    self.console.print(f"[green]{line}[/green]")
+                elif line.startswith('-'):
+                    self.console.print(f"[red]{line}[/red]")
+                elif line.startswith('@@'):
+                    self.console.print(f"[cyan]{line}[/cyan]")
+                else:
+                    self.console.print(line)
+            process.wait()
+            if process.returncode != 0 or not printed_any:
                 self.console.print("[yellow]No differences found or file is staged[/yellow]")
 
     def display_git_status(self):
@@ -171,28 +576,34 @@ class GitBuddy:
             return
         
         self.console.print("\n[bold]Git Status:[/bold]")
-        
-        if new_files:
-            self.console.print(f"\n[bold green]New files ({len(new_files)}):[/bold green]")
-            for file in new_files:
-                self.console.print(f"  [green]+[/green] {file}")
-        
-        if modified_files:
-            self.console.print(f"\n[bold yellow]Modified files ({len(modified_files)}):[/bold yellow]")
-            for file in modified_files:
-                self.console.print(f"  [yellow]M[/yellow] {file}")
-        
-        if deleted_files:
-            self.console.print(f"\n[bold red]Deleted files ({len(deleted_files)}):[/bold red]")
-            for file in deleted_files:
-                self.console.print(f"  [red]-[/red] {file}")
+
+        # One buffered Text (and one console.print) per section: Rich
+        # locks, measures and flushes per print call, which adds up
+        # quickly when hundreds of files are listed.
+        sections = (
+            (new_files, 'New files', 'green', '+'),
+            (modified_files, 'Modified files', 'yellow', 'M'),
+            (deleted_files, 'Deleted files', 'red', '-'),
+        )
+        for file_list, label, color, marker in sections:
+            if not file_list:
+                continue
+            text = Text()
+            text.append(f"\n{label} ({len(file_list)}):\n", style=f"bold {color}")
+            for file in file_list:
+                text.append("  ")
+                text.append(marker, style=color)
+                text.append(f" {file}\n")
+            self.console.print(text, end='')
         
         # Offer to show diffs
         if modified_files or new_files:
             if Confirm.ask("\n[bold]Would you like to see what changed in any files?[/bold]"):
                 all_changed = modified_files + new_files
+                listing = Text()
                 for i, file in enumerate(all_changed, 1):
-                    self.console.print(f"\n[bold]{i}. {file}[/bold]")
+                    listing.append(f"\n{i}. {file}", style="bold")
+                self.console.print(listing)
                 
                 while True:
                     choice = Prompt.ask(
@@ -212,15 +623,15 @@ class GitBuddy:
                     except ValueError:
                         self.console.print("[red]Please enter a number or 'done'[/red]")
 
-    def display_file_selection(self, files: List[Path]) -> List[Path]:
+    def display_file_selection(self, files: List[FileInfo]) -> List[FileInfo]:
         """Display files and let user select which ones to push"""
         if not files:
             self.console.print("[red]No files found in the current directory[/red]")
             return []
         
         # Check if this is a git repository and show status
-        git_dir = self.current_dir / '.git'
-        if git_dir.exists():
+        if self._in_git_repo():
+            self._prefetch_repo_state()
             self.display_git_status()
             
             # Get changed files
@@ -242,157 +653,334 @@ class GitBuddy:
                 elif choice == "all":
                     files = files
                 else:  # select
+                    files.sort(key=lambda info: info.relpath)
                     return self.select_specific_files(files)
             else:
                 self.console.print("\n[yellow]No changes detected, showing all files[/yellow]")
         
+        # Deferred from get_files_in_directory: sort only when a
+        # numbered listing is displayed.
+        files.sort(key=lambda info: info.relpath)
+
+        if len(files) > self._MAX_TABLE_ROWS:
+            # Don't build a huge table nobody asked for: summarize, ask
+            # first, and render (a capped page) only for "select".
+            self.console.print(f"\n[bold]{len(files)} files in directory[/bold]")
+
+            choice = Prompt.ask(
+                "\n[bold]Select files to push[/bold]",
+                choices=["all", "select", "quit"],
+                default="all"
+            )
+
+            if choice == "quit":
+                return []
+            elif choice == "all":
+                self.console.print(f"[green]Selected all {len(files)} file(s)[/green]")
+                return files
+            else:
+                self._render_file_table(files)
+                return self.select_specific_files(files)
+
         self.console.print("\n[bold]All files in directory:[/bold]")
-        
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Index", style="dim", width=6)
-        table.add_column("File Path", style="cyan")
-        table.add_column("Size", style="green", width=10)
-        table.add_column("Status", style="yellow", width=8)
-        
-        # Get git status for file marking
-        modified_files, new_files, deleted_files = self.get_git_status()
-        all_changed = set(modified_files + new_files)
-        
-        for i, file_path in enumerate(files, 1):
-            try:
-                size = file_path.stat().st_size
-                size_str = self.format_file_size(size)
-            except:
-                size_str = "N/A"
-            
-            relative_path = str(file_path.relative_to(self.current_dir))
-            status = "NEW" if relative_path in new_files else "MODIFIED" if relative_path in modified_files else "UNCHANGED"
-            
-            table.add_row(str(i), relative_path, size_str, status)
-            
-        self.console.print(table)
-        
+        self._render_file_table(files)
+
         choice = Prompt.ask(
             "\n[bold]Select files to push[/bold]",
             choices=["all", "select", "quit"],
             default="all"
         )
-        
+
         if choice == "quit":
             return []
         elif choice == "all":
             return files
         else:
             return self.select_specific_files(files)
+
+    # Rendering more rows than this holds the whole Rich table in
+    # memory for listings nobody will read line by line.
+    _MAX_TABLE_ROWS = 200
+
+    def _render_file_table(self, files: List[FileInfo]):
+        """Render the numbered file listing, capped at _MAX_TABLE_ROWS rows
+
+        Small listings get the full Rich table; anything larger is
+        printed as one plain fixed-width block with markup disabled,
+        which skips Rich's per-row parsing and measuring entirely.
+        """
+        # Get git status for file marking; sets make the per-row status
+        # lookup O(1) instead of scanning the changed-file lists.
+        modified_files, new_files, deleted_files = self.get_git_status()
+        new_set = set(new_files)
+        mod_set = set(modified_files)
+
+        if len(files) > self._MAX_TABLE_ROWS:
+            lines = []
+            for i, info in enumerate(files[:self._MAX_TABLE_ROWS], 1):
+                size_str = self.format_file_size(info.size)
+                status = "NEW" if info.relpath in new_set else "MODIFIED" if info.relpath in mod_set else "UNCHANGED"
+                lines.append(f"{i:>6}  {info.relpath:<60} {size_str:>10}  {status}")
+            lines.append(f"   ...  ({len(files) - self._MAX_TABLE_ROWS} more files, selectable by number)")
+            self.console.print('\n'.join(lines), markup=False, highlight=False)
+            return
+
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Index", style="dim", width=6)
+        table.add_column("File Path", style="cyan")
+        table.add_column("Size", style="green", width=10)
+        table.add_column("Status", style="yellow", width=8)
+
+        for i, info in enumerate(files, 1):
+            size_str = self.format_file_size(info.size)
+            status = "NEW" if info.relpath in new_set else "MODIFIED" if info.relpath in mod_set else "UNCHANGED"
+
+            table.add_row(str(i), info.relpath, size_str, status)
+
+        self.console.print(table)
     
-    def select_specific_files(self, files: List[Path]) -> List[Path]:
+    def select_specific_files(self, files: List[FileInfo]) -> List[FileInfo]:
         """Let user select specific files by index"""
-        selected_files = []
-        
+        # Dedup on the integer index: O(1) membership instead of
+        # scanning a growing list of records for every entry.
+        selected_indices = set()
+
         while True:
             selection = Prompt.ask(
-                "\nEnter file numbers (comma-separated, e.g., 1,3,5) or 'done' to finish"
+                "\nEnter file numbers or ranges (e.g., 1,3,5-9) or 'done' to finish"
             )
-            
+
             if selection.lower() == 'done':
                 break
-                
-            try:
-                indices = [int(i.strip()) for i in selection.split(',')]
-                for idx in indices:
-                    if 1 <= idx <= len(files):
-                        file_path = files[idx - 1]
-                        if file_path not in selected_files:
-                            selected_files.append(file_path)
-                            self.console.print(f"[green]✓[/green] Added: {file_path.relative_to(self.current_dir)}")
-                    else:
-                        self.console.print(f"[red]Invalid index: {idx}[/red]")
-            except ValueError:
-                self.console.print("[red]Invalid input. Please enter numbers separated by commas.[/red]")
-                
-        return selected_files
+
+            matches = list(_SELECTION_RE.finditer(selection))
+            if not matches:
+                self.console.print("[red]Invalid input. Enter numbers or ranges like 1,3,5-9.[/red]")
+                continue
+
+            # Buffer the feedback and flush once per entered batch:
+            # a console.print per file parses markup and re-renders
+            # for every line.
+            feedback = Text()
+            for match in matches:
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else start
+                if start > end:
+                    start, end = end, start
+                if end < 1 or start > len(files):
+                    feedback.append(f"Invalid selection: {match.group(0)}\n", style="red")
+                    continue
+                for idx in range(max(start, 1), min(end, len(files)) + 1):
+                    if idx - 1 not in selected_indices:
+                        selected_indices.add(idx - 1)
+                        feedback.append("✓ ", style="green")
+                        feedback.append(f"Added: {files[idx - 1].relpath}\n")
+            if feedback:
+                self.console.print(feedback, end="")
+
+        return [files[i] for i in sorted(selected_indices)]
     
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
     def format_file_size(self, size: int) -> str:
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f}{unit}"
-            size /= 1024.0
-        return f"{size:.1f}TB"
+        # Pick the unit straight from the bit length instead of looping
+        # with float divisions — constant time per call, which matters
+        # when formatting a table row for every file.
+        if size <= 0:
+            return "0.0B"
+        idx = min((size.bit_length() - 1) // 10, len(self._SIZE_UNITS) - 1)
+        return f"{size / (1 << (idx * 10)):.1f}{self._SIZE_UNITS[idx]}"
     
-    def run_git_command(self, command: List[str], cwd: Path = None) -> Tuple[bool, str]:
+    # Default timeout for worktree-sized commands (status, add, commit);
+    # quick local probes pass _FAST_TIMEOUT, and anything touching the
+    # network goes through _run_git_streaming with no timeout at all.
+    _FAST_TIMEOUT = 5
+
+    def run_git_command(self, command: List[str], cwd: Path = None, input_text: str = None,
+                        timeout: int = 30) -> Tuple[bool, str]:
         """Execute git command and return success status and output"""
         if cwd is None:
             cwd = self.current_dir
-            
+
         try:
             result = subprocess.run(
                 command,
                 cwd=cwd,
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=timeout,
+                input=input_text
             )
             return result.returncode == 0, result.stdout + result.stderr
         except subprocess.TimeoutExpired:
-            return False, "Command timed out after 30 seconds"
+            return False, f"Command timed out after {timeout} seconds"
         except Exception as e:
             return False, str(e)
     
+    def _run_git_sequence(self, fragments: List[str]) -> Tuple[bool, str]:
+        """Run several shell-quoted git commands as one '&&' chain
+
+        Collapses a deterministic series of git operations into a single
+        subprocess so the fork/exec and git startup cost is paid once
+        instead of once per step. Callers must pre-quote each fragment
+        (see _shell_join) since user input ends up on the command line.
+        """
+        joined = ' && '.join(fragments)
+        try:
+            result = subprocess.run(
+                joined,
+                shell=True,
+                cwd=self.current_dir,
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+            return result.returncode == 0, result.stdout + result.stderr
+        except subprocess.TimeoutExpired:
+            return False, "Command timed out after 60 seconds"
+        except Exception as e:
+            return False, str(e)
+
+    def _run_git_streaming(self, command: List[str], on_line=None) -> Tuple[bool, str, Optional[str]]:
+        """Run a git command, streaming its stderr line by line
+
+        git reports push progress and errors on stderr; each line is
+        forwarded to on_line as it arrives (so long pushes show live
+        progress instead of a frozen spinner) and matched against
+        _PUSH_ERROR_RE in the same pass. Progress updates from git are
+        carriage-return terminated, so raw chunks are split on \\r as
+        well as \\n — a plain line iterator would sit on them until the
+        command exited. Returns (success, output, error_kind) where
+        error_kind is the first classification hit, or None.
+        """
+        try:
+            proc = subprocess.Popen(
+                command,
+                cwd=self.current_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        except Exception as e:
+            return False, str(e), None
+
+        lines = []
+        error_kind = None
+
+        def _handle(raw: bytes):
+            nonlocal error_kind
+            line = raw.decode('utf-8', 'replace')
+            lines.append(line)
+            if on_line:
+                on_line(line)
+            if error_kind is None:
+                match = _PUSH_ERROR_RE.search(line)
+                if match:
+                    error_kind = match.lastgroup
+
+        tail = b''
+        while True:
+            chunk = proc.stderr.read1(4096)
+            if not chunk:
+                break
+            tail += chunk
+            parts = _LINE_BREAK_RE.split(tail)
+            tail = parts.pop()
+            for raw in parts:
+                if raw:
+                    _handle(raw)
+        if tail:
+            _handle(tail)
+        proc.wait()
+        return proc.returncode == 0, '\n'.join(lines), error_kind
+
     def initialize_git_repo(self) -> bool:
         """Initialize git repository if not already initialized"""
-        git_dir = self.current_dir / '.git'
-        if git_dir.exists():
+        if self._in_git_repo():
             self.console.print("[green]✓[/green] Git repository already initialized")
             return True
             
         self.console.print("[yellow]Initializing git repository...[/yellow]")
-        success, output = self.run_git_command(['git', 'init'])
-        
+        success, output = self.run_git_command(['git', 'init'], timeout=self._FAST_TIMEOUT)
+
         if success:
+            self._invalidate_status()
+            self._is_git_repo = True
             self.console.print("[green]✓[/green] Git repository initialized")
             return True
         else:
             self.console.print(f"[red]✗[/red] Failed to initialize git repository: {output}")
             return False
     
-    def add_files_to_git(self, files: List[Path]) -> bool:
+    # Roughly how many paths fit safely on one git add command line
+    # before falling back to feeding them over stdin.
+    _ADD_ARGV_LIMIT = 1000
+
+    def add_files_to_git(self, files: List[FileInfo]) -> bool:
         """Add selected files to git staging area"""
         self.console.print("[yellow]Adding files to git...[/yellow]")
-        
-        for file_path in files:
-            relative_path = file_path.relative_to(self.current_dir)
-            success, output = self.run_git_command(['git', 'add', str(relative_path)])
-            
-            if success:
-                self.console.print(f"[green]✓[/green] Added: {relative_path}")
-            else:
-                self.console.print(f"[red]✗[/red] Failed to add {relative_path}: {output}")
-                return False
-                
-        return True
+
+        rel_paths = [info.relpath for info in files]
+
+        # One subprocess for the whole selection: git reads/writes its
+        # index once instead of once per file.
+        if len(rel_paths) <= self._ADD_ARGV_LIMIT:
+            success, output = self.run_git_command(['git', 'add', '--'] + rel_paths)
+        else:
+            # Very large selections could exceed ARG_MAX; stream the
+            # paths over stdin instead. NUL separators keep filenames
+            # with newlines or leading/trailing spaces intact.
+            success, output = self.run_git_command(
+                ['git', 'add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                input_text='\0'.join(rel_paths)
+            )
+
+        if success:
+            self._invalidate_status()
+            self._staged_count = len(rel_paths)
+            # One summary line: per-file prints are pure rendering
+            # overhead once the add itself is a single batch.
+            self.console.print(f"[green]✓[/green] Added {len(rel_paths)} file(s)")
+            return True
+        else:
+            self.console.print(f"[red]✗[/red] Failed to add files: {output}")
+            return False
     
     def commit_changes(self, commit_message: str) -> bool:
         """Commit changes with the provided message"""
         self.console.print("[yellow]Committing changes...[/yellow]")
         
-        # First check if there are any changes to commit
-        success, status_output = self.run_git_command(['git', 'status', '--porcelain'])
-        if success and not status_output.strip():
-            self.console.print("[yellow]No changes to commit[/yellow]")
-            return True
-            
-        # Check for untracked files and add them
-        success, status_output = self.run_git_command(['git', 'status', '--porcelain'])
-        if success and status_output:
-            untracked_files = [line[3:] for line in status_output.split('\n') if line.startswith('??')]
-            if untracked_files:
-                self.console.print(f"[yellow]Found {len(untracked_files)} untracked files, adding them...[/yellow]")
-                for file in untracked_files:
-                    self.run_git_command(['git', 'add', file])
+        # 'git diff --cached --quiet' exits non-zero when something is
+        # already staged — much cheaper than parsing a full porcelain
+        # status on the fast path where add_files_to_git just staged the
+        # selection.
+        # When add_files_to_git just staged the user's selection there is
+        # nothing to re-probe — and auto-adding untracked siblings would
+        # pull in files the user deliberately left out.
+        if self._staged_count == 0:
+            nothing_staged, _ = self.run_git_command(['git', 'diff', '--cached', '--quiet'], timeout=self._FAST_TIMEOUT)
+            if nothing_staged:
+                # One NUL-delimited status pass: robust against filenames
+                # with spaces or newlines, and parsed exactly once.
+                success, status_output = self.run_git_command(['git', 'status', '--porcelain', '-z'])
+                records = [r for r in status_output.split('\0') if r] if success else []
+
+                if success and not records:
+                    self.console.print("[yellow]No changes to commit[/yellow]")
+                    return True
+
+                # Offer to stage untracked files in a single batched add
+                untracked_files = [r[3:] for r in records if r.startswith('??')]
+                if untracked_files:
+                    if Confirm.ask(f"Found {len(untracked_files)} untracked file(s). Add them to this commit?"):
+                        self.run_git_command(['git', 'add', '--'] + untracked_files)
         
         success, output = self.run_git_command(['git', 'commit', '-m', commit_message])
-        
+        self._invalidate_status()
+        self._staged_count = 0
+
         if success:
             self.console.print("[green]✓[/green] Changes committed successfully")
             return True
@@ -409,22 +997,39 @@ class GitBuddy:
                 self.console.print(f"[red]✗[/red] Failed to commit: {output}")
                 return False
     
+    def _read_origin_url(self) -> Optional[str]:
+        """Read the remote "origin" URL straight from .git/config
+
+        .git/config is plain INI, so a configparser read answers the
+        "is the remote already set?" probe without spawning a git
+        subprocess. Returns None when the file or section is missing.
+        """
+        config_path = self.current_dir / '.git' / 'config'
+        if not config_path.exists():
+            return None
+
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(config_path)
+            return parser.get('remote "origin"', 'url', fallback=None)
+        except configparser.Error:
+            return None
+
     def add_remote_origin(self, repo_url: str) -> bool:
         """Add remote origin to the repository"""
-        # Check if remote already exists
-        success, output = self.run_git_command(['git', 'remote', 'get-url', 'origin'])
-        
-        if success:
-            current_url = output.strip()
+        # Check if remote already exists (read from .git/config, no subprocess)
+        current_url = self._read_origin_url()
+
+        if current_url is not None:
             if current_url == repo_url:
                 self.console.print("[green]✓[/green] Remote origin already set correctly")
                 return True
             else:
                 self.console.print(f"[yellow]Updating remote origin from {current_url} to {repo_url}[/yellow]")
-                success, output = self.run_git_command(['git', 'remote', 'set-url', 'origin', repo_url])
+                success, output = self.run_git_command(['git', 'remote', 'set-url', 'origin', repo_url], timeout=self._FAST_TIMEOUT)
         else:
             self.console.print("[yellow]Adding remote origin...[/yellow]")
-            success, output = self.run_git_command(['git', 'remote', 'add', 'origin', repo_url])
+            success, output = self.run_git_command(['git', 'remote', 'add', 'origin', repo_url], timeout=self._FAST_TIMEOUT)
         
         if success:
             self.console.print("[green]✓[/green] Remote origin configured")
@@ -435,9 +1040,13 @@ class GitBuddy:
     
     def get_current_branch(self) -> str:
         """Get the current git branch name"""
-        success, output = self.run_git_command(['git', 'branch', '--show-current'])
+        if self._branch_cache is not None:
+            return self._branch_cache
+
+        success, output = self.run_git_command(['git', 'branch', '--show-current'], timeout=self._FAST_TIMEOUT)
         if success and output.strip():
-            return output.strip()
+            self._branch_cache = output.strip()
+            return self._branch_cache
         
         # Fallback: try to get branch from git status
         success, output = self.run_git_command(['git', 'status', '--porcelain', '-b'])
@@ -451,8 +1060,12 @@ class GitBuddy:
         
         return "main"  # Default fallback
 
-    def handle_push_conflicts(self, branch: str = "main") -> bool:
-        """Handle push conflicts by trying different strategies"""
+    def handle_push_conflicts(self, branch: str) -> bool:
+        """Handle push conflicts by trying different strategies
+
+        branch is required: push_to_github already resolved it, so
+        re-deriving it here would just repeat the probe.
+        """
         self.console.print("[yellow]Attempting to resolve push conflicts...[/yellow]")
         
         # First, let's see what branch we're actually on
@@ -461,37 +1074,53 @@ class GitBuddy:
             self.console.print(f"[yellow]Current branch is '{current_branch}', but trying to push to '{branch}'[/yellow]")
             
             # Try to checkout the target branch or create it
-            success, output = self.run_git_command(['git', 'checkout', '-B', branch])
+            success, output = self.run_git_command(['git', 'checkout', '-B', branch], timeout=self._FAST_TIMEOUT)
             if success:
+                self._branch_cache = branch
                 self.console.print(f"[green]✓[/green] Switched to branch '{branch}'")
             else:
                 self.console.print(f"[yellow]Using current branch '{current_branch}' instead[/yellow]")
                 branch = current_branch
         
-        # Try to pull and merge
-        self.console.print("[yellow]Trying to pull and merge remote changes...[/yellow]")
-        success, output = self.run_git_command(['git', 'pull', 'origin', branch, '--allow-unrelated-histories'])
-        
-        if success:
-            self.console.print("[green]✓[/green] Successfully merged remote changes")
-            # Now try to push again
-            success, output = self.run_git_command(['git', 'push', '-u', 'origin', branch])
+        # Fetch first, then merge only if actually needed: when
+        # origin/<branch> is already an ancestor of HEAD a pull's merge
+        # step is pure wasted object-graph walking.
+        self.console.print("[yellow]Fetching remote changes...[/yellow]")
+        success, output, error_kind = self._run_git_streaming(['git', 'fetch', 'origin', branch])
+
+        if not success and (error_kind == 'no_remote_ref' or "couldn't find remote ref" in output.lower()):
+            self.console.print("[yellow]No remote branch found, creating new remote branch...[/yellow]")
+            success, output, _ = self._run_git_streaming(['git', 'push', '-u', 'origin', branch])
             if success:
-                self.console.print("[green]✓[/green] Successfully pushed after merge!")
+                self.console.print("[green]✓[/green] Successfully pushed new branch!")
                 return True
-        else:
-            # If pull failed due to no tracking branch, set upstream and try again
-            if "no tracking information" in output.lower() or "couldn't find remote ref" in output.lower():
-                self.console.print("[yellow]No remote branch found, creating new remote branch...[/yellow]")
-                success, output = self.run_git_command(['git', 'push', '-u', 'origin', branch])
+
+        if success:
+            merged = True
+            ancestor, _ = self.run_git_command(
+                ['git', 'merge-base', '--is-ancestor', f'origin/{branch}', 'HEAD'],
+                timeout=self._FAST_TIMEOUT
+            )
+            if not ancestor:
+                self.console.print("[yellow]Merging remote changes...[/yellow]")
+                merged, output, _ = self._run_git_streaming(['git', 'merge', '--no-edit', f'origin/{branch}'])
+                if not merged and 'unrelated histories' in output.lower():
+                    # Only reach for --allow-unrelated-histories when git
+                    # explicitly asked for it, not on every conflict.
+                    merged, output, _ = self._run_git_streaming(
+                        ['git', 'merge', '--no-edit', '--allow-unrelated-histories', f'origin/{branch}']
+                    )
+            if merged:
+                self.console.print("[green]✓[/green] Local branch is up to date with remote")
+                success, output, _ = self._run_git_streaming(['git', 'push', '-u', 'origin', branch])
                 if success:
-                    self.console.print("[green]✓[/green] Successfully pushed new branch!")
+                    self.console.print("[green]✓[/green] Successfully pushed after merge!")
                     return True
         
         # If pull failed, try force push with lease (safer than regular force push)
         self.console.print("[yellow]Trying force push with lease (safe overwrite)...[/yellow]")
         if Confirm.ask("[bold red]This will overwrite remote repository. Continue?[/bold red]"):
-            success, output = self.run_git_command(['git', 'push', '--force-with-lease', 'origin', branch])
+            success, output, _ = self._run_git_streaming(['git', 'push', '--force-with-lease', 'origin', branch])
             if success:
                 self.console.print("[green]✓[/green] Successfully force pushed!")
                 return True
@@ -499,7 +1128,7 @@ class GitBuddy:
                 # Try regular force push as last resort
                 self.console.print("[yellow]Force with lease failed, trying regular force push...[/yellow]")
                 if Confirm.ask("[bold red]This is more dangerous. Really continue?[/bold red]"):
-                    success, output = self.run_git_command(['git', 'push', '--force', 'origin', branch])
+                    success, output, _ = self._run_git_streaming(['git', 'push', '--force', 'origin', branch])
                     if success:
                         self.console.print("[green]✓[/green] Successfully force pushed!")
                         return True
@@ -514,46 +1143,60 @@ class GitBuddy:
             branch = self.get_current_branch()
             
         self.console.print(f"[yellow]Pushing to GitHub ({branch} branch)...[/yellow]")
-        
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=self.console
         ) as progress:
             task = progress.add_task("Pushing to GitHub...", total=None)
-            
-            success, output = self.run_git_command(['git', 'push', '-u', 'origin', branch])
-            
+
+            def _show_progress(line):
+                line = line.strip()
+                if line:
+                    progress.update(task, description=line[:80])
+
+            # --progress: git suppresses the counting/compressing/
+            # writing phases when stderr is a pipe, so force them for
+            # the spinner to have anything live to show.
+            success, output, error_kind = self._run_git_streaming(
+                ['git', 'push', '--progress', '-u', 'origin', branch],
+                on_line=_show_progress
+            )
+
         if success:
             self.console.print("[green]✓[/green] Successfully pushed to GitHub!")
             return True
         else:
-            # Handle common push errors with more detail
-            if "remote: Repository not found" in output or "repository does not exist" in output.lower():
+            # Handle common push errors with more detail (classified in
+            # a single pass while the output was streamed)
+            if error_kind == 'not_found':
                 self.console.print("[red]✗[/red] Repository not found. Make sure:")
                 self.console.print("  1. The repository exists on GitHub")
                 self.console.print("  2. You have access to the repository")
                 self.console.print("  3. Your GitHub credentials are configured")
                 self.console.print("  4. The repository URL is correct")
                 return False
-            elif "Permission denied" in output or "Authentication failed" in output or "access denied" in output.lower():
+            elif error_kind == 'auth':
                 self.console.print("[red]✗[/red] Permission denied. Please check your GitHub authentication:")
                 self.console.print("  1. Generate a personal access token at: https://github.com/settings/tokens")
                 self.console.print("  2. Use your GitHub username and token as password when prompted")
                 self.console.print("  3. Or configure SSH keys for passwordless access")
                 self.console.print("  4. Make sure you have write access to the repository")
                 return False
-            elif "support for password authentication was removed" in output.lower():
+            elif error_kind == 'password_removed':
                 self.console.print("[red]✗[/red] Password authentication is no longer supported. You need:")
                 self.console.print("  1. A personal access token instead of your password")
                 self.console.print("  2. Go to: https://github.com/settings/tokens")
                 self.console.print("  3. Generate a token with 'repo' permissions")
                 self.console.print("  4. Use token as password when Git asks for credentials")
                 return False
-            elif "failed to push some refs" in output or "non-fast-forward" in output or "Updates were rejected" in output or "rejected" in output.lower():
+            elif error_kind == 'conflict':
                 # Try to handle push conflicts
                 return self.handle_push_conflicts(branch)
-            elif "couldn't find remote ref" in output.lower():
+            elif error_kind == 'no_remote_ref':
                 self.console.print(f"[yellow]Remote branch '{branch}' doesn't exist, creating it...[/yellow]")
                 return self.handle_push_conflicts(branch)
             else:
@@ -564,12 +1207,50 @@ class GitBuddy:
                     return self.handle_push_conflicts(branch)
                 return False
     
+    def _run_git_fast_path(self, files: List[FileInfo], commit_message: str, repo_url: str) -> bool:
+        """Stage, commit and configure the remote in one subprocess
+
+        Happy-path shortcut for run(): chains init (when needed), add,
+        commit and remote configuration through _run_git_sequence. Push
+        stays separate so its errors can still be parsed individually.
+        Returns False on any failure so the caller can retry with the
+        step-by-step helpers and their detailed error messages. POSIX
+        shells only: the quoting and '&&'/'||' chain are wrong under
+        cmd.exe, so on other platforms we go straight to the fallback.
+        """
+        if os.name != 'posix':
+            return False
+        rel_paths = [info.relpath for info in files]
+        if len(rel_paths) > self._ADD_ARGV_LIMIT:
+            return False
+
+        fragments = []
+        if not self._in_git_repo():
+            fragments.append(_shell_join(['git', 'init', '-q']))
+        fragments.append(_shell_join(['git', 'add', '--'] + rel_paths))
+        fragments.append(_shell_join(['git', 'commit', '-m', commit_message]))
+        set_url = _shell_join(['git', 'remote', 'set-url', 'origin', repo_url])
+        add_url = _shell_join(['git', 'remote', 'add', 'origin', repo_url])
+        fragments.append(f'({set_url} 2>/dev/null || {add_url})')
+
+        success, output = self._run_git_sequence(fragments)
+        if success:
+            self._invalidate_status()
+            self._is_git_repo = True
+            self.console.print("[green]✓[/green] Files staged, committed and remote configured")
+        return success
+
     def run(self):
         """Main application loop"""
         self.display_header()
         
         try:
             while True:
+                # Fresh iteration: anything cached from the previous
+                # push may be stale
+                self._invalidate_status()
+                self._staged_count = 0
+
                 # Get repository URL
                 repo_url = Prompt.ask("\n[bold]Enter GitHub repository URL (or 'quit' to exit)[/bold]")
                 
@@ -610,19 +1291,24 @@ class GitBuddy:
                 if not Confirm.ask("\nProceed with git operations?"):
                     continue
                 
-                # Execute git operations
-                if not self.initialize_git_repo():
-                    continue
-                    
-                if not self.add_files_to_git(selected_files):
-                    continue
-                    
-                if not self.commit_changes(commit_message):
-                    continue
-                    
-                if not self.add_remote_origin(parsed_url):
-                    continue
-                    
+                # Execute git operations. The deterministic prefix
+                # (init, add, commit, remote) is chained through one
+                # shell invocation; if anything in the chain fails we
+                # fall back to the step-by-step helpers, which produce
+                # the detailed per-step error messages.
+                if not self._run_git_fast_path(selected_files, commit_message, parsed_url):
+                    if not self.initialize_git_repo():
+                        continue
+
+                    if not self.add_files_to_git(selected_files):
+                        continue
+
+                    if not self.commit_changes(commit_message):
+                        continue
+
+                    if not self.add_remote_origin(parsed_url):
+                        continue
+
                 if self.push_to_github():
                     self.console.print("\n[bold green]🎉 Success! Your files have been pushed to GitHub![/bold green]")
                 
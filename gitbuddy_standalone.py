@@ -9,11 +9,17 @@ import os
 import sys
 import subprocess
 import re
-from pathlib import Path
-from typing import List, Optional, Tuple
+import configparser
+import selectors
+from typing import List, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
 import time
 
+# Emit ANSI escapes only when stdout is an interactive terminal and
+# the user hasn't opted out via NO_COLOR; piped or redirected output
+# stays plain instead of carrying escape bytes into logs.
+_USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
 # Simple terminal colors without rich dependency
 class Colors:
     RED = '\033[91m'
@@ -27,16 +33,34 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+if not _USE_COLOR:
+    # Blank the escape constants so every colored fragment — including
+    # the precomputed prefixes below — degrades to plain text.
+    for _name in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN',
+                  'WHITE', 'BOLD', 'UNDERLINE', 'END'):
+        setattr(Colors, _name, '')
+    del _name
+
 def colored(text: str, color: str) -> str:
     """Add color to text"""
-    return f"{color}{text}{Colors.END}"
+    return f"{color}{text}{Colors.END}" if _USE_COLOR else text
+
+# Pre-wrapped per-file prefixes for the status listing, built once at
+# import so the per-file loop concatenates instead of re-wrapping the
+# marker in escape codes for every printed line.
+_NEW_PREFIX = f"  {Colors.GREEN}+{Colors.END} "
+_MOD_PREFIX = f"  {Colors.YELLOW}M{Colors.END} "
+_DEL_PREFIX = f"  {Colors.RED}-{Colors.END} "
 
 def print_header():
     """Print application header"""
-    print("=" * 80)
-    print(colored("🚀 Git Buddy - Terminal Git Helper", Colors.BOLD + Colors.BLUE))
-    print(colored("Push your files to GitHub with ease", Colors.CYAN))
-    print("=" * 80)
+    bar = "=" * 80
+    sys.stdout.write(
+        bar + "\n"
+        + colored("🚀 Git Buddy - Terminal Git Helper", Colors.BOLD + Colors.BLUE) + "\n"
+        + colored("Push your files to GitHub with ease", Colors.CYAN) + "\n"
+        + bar + "\n"
+    )
 
 def print_status(status: str, message: str):
     """Print status message with color"""
@@ -65,82 +89,255 @@ def get_input(prompt: str, default: str = None) -> str:
 
 def confirm(prompt: str) -> bool:
     """Ask for yes/no confirmation"""
+    # Build the prompt once; retries reuse the same string instead of
+    # re-concatenating through get_input on every loop pass.
+    prompt_str = f"{prompt} (y/n) (y): "
     while True:
-        response = get_input(f"{prompt} (y/n)", "y").lower()
-        if response in ['y', 'yes']:
+        try:
+            response = input(prompt_str).strip().lower() or "y"
+        except KeyboardInterrupt:
+            print("\n👋 Goodbye!")
+            sys.exit(0)
+        if response in ('y', 'yes'):
             return True
-        elif response in ['n', 'no']:
+        elif response in ('n', 'no'):
             return False
         print(colored("Please enter 'y' or 'n'", Colors.RED))
 
-def run_command(command: List[str], cwd: Path = None) -> Tuple[bool, str]:
-    """Execute command and return success status and output"""
-    if cwd is None:
-        cwd = Path.cwd()
-        
+def run_command(command: List[str], cwd: Optional[str] = None, timeout: int = 30,
+                capture: bool = True) -> Tuple[bool, str]:
+    """Execute command and return success status and output
+
+    Drains stdout/stderr with a selector loop: the process blocks in
+    select() while the command runs (no polling), both pipes are read
+    as data arrives so a chatty command can never deadlock on a full
+    pipe buffer, and the timeout applies to the whole run. Windows
+    select() can't watch pipes, so it falls back to subprocess.run
+    there.
+
+    cwd=None lets the child inherit our working directory directly —
+    no getcwd() syscall per command just to pass the same path along.
+    capture=False sends stdout to /dev/null for callers that only care
+    about the exit status; stderr is still collected so failures can
+    be reported.
+    """
+    stdout_target = subprocess.PIPE if capture else subprocess.DEVNULL
+
+    if sys.platform == 'win32':
+        try:
+            result = subprocess.run(
+                command,
+                cwd=cwd,
+                stdout=stdout_target,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=timeout
+            )
+            output = (result.stdout if capture else '') + result.stderr
+            return result.returncode == 0, output
+        except subprocess.TimeoutExpired:
+            return False, f"Command timed out after {timeout} seconds"
+        except Exception as e:
+            return False, str(e)
+
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             command,
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=30
+            stdout=stdout_target,
+            stderr=subprocess.PIPE
         )
-        return result.returncode == 0, result.stdout + result.stderr
-    except subprocess.TimeoutExpired:
-        return False, "Command timed out after 30 seconds"
+        selector = selectors.DefaultSelector()
+        if capture:
+            selector.register(process.stdout, selectors.EVENT_READ)
+        selector.register(process.stderr, selectors.EVENT_READ)
+        chunks = {process.stdout: [], process.stderr: []}
+        deadline = time.monotonic() + timeout
+
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                selector.close()
+                process.kill()
+                process.wait()
+                return False, f"Command timed out after {timeout} seconds"
+            for key, _ in selector.select(remaining):
+                data = key.fileobj.read1(65536)
+                if data:
+                    chunks[key.fileobj].append(data)
+                else:
+                    selector.unregister(key.fileobj)
+
+        selector.close()
+        process.wait()
+        stdout_bytes = b''.join(chunks[process.stdout]) if capture else b''
+        output = stdout_bytes + b''.join(chunks[process.stderr])
+        return process.returncode == 0, output.decode('utf-8', 'replace')
     except Exception as e:
         return False, str(e)
 
+# Every accepted GitHub URL shape as one alternation, compiled once at
+# import: a single match replaces the loop over three patterns that
+# were re-parsed on each call. The non-greedy repo group lets the
+# optional '.git' suffix (and trailing slash) be stripped by the regex
+# itself.
+_GH_URL_RE = re.compile(
+    r'^(?:https://github\.com/|git@github\.com:)?([^/:@\s]+)/([^/\s]+?)(?:\.git)?/?$'
+)
+
 def validate_github_url(url: str) -> Tuple[bool, Optional[str]]:
     """Validate and parse GitHub repository URL"""
     if not url:
         return False, "URL cannot be empty"
-        
-    patterns = [
-        r'^https://github\.com/([^/]+)/([^/]+)/?(?:\.git)?$',
-        r'^git@github\.com:([^/]+)/([^/]+)\.git$',
-        r'^([^/]+)/([^/]+)$'
-    ]
-    
-    for pattern in patterns:
-        match = re.match(pattern, url.strip())
-        if match:
-            owner, repo = match.groups()
-            repo = repo.replace('.git', '')
-            return True, f"https://github.com/{owner}/{repo}.git"
-            
+
+    url = url.strip()
+
+    # Cheap prefix dispatch for the overwhelmingly common well-formed
+    # inputs; the regex engine only sees unusual or malformed strings.
+    tail = None
+    if url.startswith('https://github.com/'):
+        tail = url[len('https://github.com/'):]
+    elif url.startswith('git@github.com:'):
+        tail = url[len('git@github.com:'):]
+    elif url.count('/') == 1 and ':' not in url and ' ' not in url:
+        tail = url
+    if tail is not None:
+        tail = tail.rstrip('/')
+        if tail.endswith('.git'):
+            tail = tail[:-4]
+        parts = tail.split('/')
+        if len(parts) == 2 and parts[0] and parts[1]:
+            return True, f"https://github.com/{parts[0]}/{parts[1]}.git"
+
+    match = _GH_URL_RE.match(url)
+    if match:
+        owner, repo = match.groups()
+        return True, f"https://github.com/{owner}/{repo}.git"
+
     return False, "Invalid GitHub URL format. Use: https://github.com/owner/repo or owner/repo"
 
-def get_git_status() -> Tuple[List[str], List[str], List[str]]:
-    """Get git status and return lists of modified, new, and deleted files"""
-    success, output = run_command(['git', 'status', '--porcelain'])
-    
+class RepoState(NamedTuple):
+    modified: List[str]
+    new: List[str]
+    deleted: List[str]
+    branch: str
+
+# Every two-character porcelain-v2 XY combination mapped to its bucket
+# once at import: a single dict lookup classifies each record, instead
+# of three substring scans per line. Deletion wins over modification
+# over addition, mirroring the old cascade.
+_V2_DISPATCH = {}
+for _x in '.MADRCU':
+    for _y in '.MADRCU':
+        _code = _x + _y
+        if 'D' in _code:
+            _V2_DISPATCH[_code] = 'D'
+        elif 'M' in _code:
+            _V2_DISPATCH[_code] = 'M'
+        elif 'A' in _code:
+            _V2_DISPATCH[_code] = 'N'
+del _x, _y, _code
+
+# Parsed repository state, shared by every helper in one main-loop
+# iteration so status and branch cost a single git process between
+# mutations.
+_repo_state = None  # type: Optional[RepoState]
+
+def invalidate_repo_state():
+    """Drop the cached repo state after a mutating git operation"""
+    global _repo_state
+    _repo_state = None
+
+def get_repo_state() -> RepoState:
+    """Read status and branch from a single git invocation, cached
+
+    'git status --porcelain=v2 --branch -z' reports the changed files
+    and the current branch in one process, so the separate
+    'git branch --show-current' probe (and its status fallback)
+    disappears. NUL-terminated records parse cleanly regardless of
+    filename quoting.
+    """
+    global _repo_state
+    if _repo_state is not None:
+        return _repo_state
+
+    success, output = run_command(['git', 'status', '--porcelain=v2', '--branch', '-z'])
+
     modified_files = []
     new_files = []
     deleted_files = []
-    
+    branch = "main"
+
+    targets = {'M': modified_files, 'N': new_files, 'D': deleted_files}
+
     if success and output:
-        for line in output.strip().split('\n'):
-            if len(line) < 3:
+        records = iter(output.split('\0'))
+        for record in records:
+            if record.startswith('# branch.head '):
+                head = record[14:]
+                if head != '(detached)':
+                    branch = head
                 continue
-                
-            status_code = line[:2]
-            file_path = line[3:]
-            
-            if status_code.strip() in ['M', 'MM', 'AM']:
-                modified_files.append(file_path)
-            elif status_code.strip() in ['A', '??', 'AM']:
-                new_files.append(file_path)
-            elif status_code.strip() in ['D', 'AD', 'MD']:
-                deleted_files.append(file_path)
-            elif status_code[0] in ['M', 'A', '?'] and status_code[1] in ['M', 'A', '?']:
-                if status_code[0] == '?' or status_code[1] == '?':
-                    new_files.append(file_path)
-                else:
-                    modified_files.append(file_path)
-    
-    return modified_files, new_files, deleted_files
+            if record.startswith('1 '):
+                # ordinary change: "1 XY sub mH mI mW hH hI path"
+                parts = record.split(' ', 8)
+                xy, file_path = parts[1], parts[8]
+            elif record.startswith('2 '):
+                # rename/copy: one extra score field, and the source
+                # path follows as its own NUL record — consume it
+                parts = record.split(' ', 9)
+                xy, file_path = parts[1], parts[9]
+                next(records, None)
+            elif record.startswith('? '):
+                new_files.append(record[2:])
+                continue
+            else:
+                continue
+
+            bucket = _V2_DISPATCH.get(xy)
+            if bucket is not None:
+                targets[bucket].append(file_path)
+
+    _repo_state = RepoState(modified_files, new_files, deleted_files, branch)
+    return _repo_state
+
+def get_git_status() -> Tuple[List[str], List[str], List[str]]:
+    """Get git status and return lists of modified, new, and deleted files"""
+    state = get_repo_state()
+    return state.modified, state.new, state.deleted
+
+class RepoInfo(NamedTuple):
+    is_repo: bool
+    branch: str
+    origin_url: Optional[str]
+
+def _read_origin_url() -> Optional[str]:
+    """Read the remote "origin" URL straight from .git/config
+
+    .git/config is plain INI, so a configparser read answers the
+    "is the remote already set?" probe without a git subprocess.
+    """
+    config_path = os.path.join('.git', 'config')
+    if not os.path.exists(config_path):
+        return None
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(config_path)
+        return parser.get('remote "origin"', 'url', fallback=None)
+    except configparser.Error:
+        return None
+
+def detect_repo_info() -> RepoInfo:
+    """Gather everything main() needs to know about the repository
+
+    One .git stat, the shared porcelain-v2 state and a config read
+    replace the separate existence check, branch probe and
+    'git remote get-url' subprocess that used to run per push.
+    """
+    if not os.path.isdir('.git'):
+        return RepoInfo(False, "main", None)
+    state = get_repo_state()
+    return RepoInfo(True, state.branch, _read_origin_url())
 
 def display_git_status():
     """Display current git status with colors"""
@@ -151,71 +348,104 @@ def display_git_status():
         return False
     
     print(colored("\nGit Status:", Colors.BOLD))
-    
-    if new_files:
-        print(colored(f"\nNew files ({len(new_files)}):", Colors.BOLD + Colors.GREEN))
-        for file in new_files:
-            print(f"  {colored('+', Colors.GREEN)} {file}")
-    
-    if modified_files:
-        print(colored(f"\nModified files ({len(modified_files)}):", Colors.BOLD + Colors.YELLOW))
-        for file in modified_files:
-            print(f"  {colored('M', Colors.YELLOW)} {file}")
-    
-    if deleted_files:
-        print(colored(f"\nDeleted files ({len(deleted_files)}):", Colors.BOLD + Colors.RED))
-        for file in deleted_files:
-            print(f"  {colored('-', Colors.RED)} {file}")
-    
+
+    # Per-file cost is one list append; each section goes out as a
+    # single write() instead of one line-buffered syscall per file.
+    sections = (
+        (new_files, 'New files', Colors.GREEN, _NEW_PREFIX),
+        (modified_files, 'Modified files', Colors.YELLOW, _MOD_PREFIX),
+        (deleted_files, 'Deleted files', Colors.RED, _DEL_PREFIX),
+    )
+    for file_list, label, color, prefix in sections:
+        if not file_list:
+            continue
+        lines = [colored(f"\n{label} ({len(file_list)}):", Colors.BOLD + color) + "\n"]
+        lines.extend(prefix + file + "\n" for file in file_list)
+        sys.stdout.write(''.join(lines))
+    sys.stdout.flush()
+
     return True
 
 def get_current_branch() -> str:
     """Get the current git branch name"""
-    success, output = run_command(['git', 'branch', '--show-current'])
-    if success and output.strip():
-        return output.strip()
-    
-    success, output = run_command(['git', 'status', '--porcelain', '-b'])
-    if success and output:
-        first_line = output.split('\n')[0]
-        if '##' in first_line:
-            branch_info = first_line.replace('## ', '')
-            if '...' in branch_info:
-                return branch_info.split('...')[0]
-            return branch_info
-    
-    return "main"
+    return get_repo_state().branch
 
-def initialize_git_repo() -> bool:
-    """Initialize git repository if not already initialized"""
-    git_dir = Path.cwd() / '.git'
-    if git_dir.exists():
+def initialize_git_repo(known_repo: Optional[bool] = None) -> bool:
+    """Initialize git repository if not already initialized
+
+    known_repo carries detect_repo_info's answer so the .git probe
+    isn't repeated within the same loop iteration.
+    """
+    is_repo = known_repo if known_repo is not None else os.path.isdir('.git')
+    if is_repo:
         print_status("success", "Git repository already initialized")
         return True
         
     print_status("info", "Initializing git repository...")
-    success, output = run_command(['git', 'init'])
+    success, output = run_command(['git', 'init'], capture=False)
     
     if success:
+        invalidate_repo_state()
         print_status("success", "Git repository initialized")
         return True
     else:
         print_status("error", f"Failed to initialize git repository: {output}")
         return False
 
+# Roughly how many paths fit safely on one git add command line
+_ADD_CHUNK = 1000
+
+# Whether user.name/user.email are configured. Only a positive answer
+# is cached: the user is expected to fix their config and retry within
+# the same session, so a negative probe must be repeated.
+_identity_ok = False
+
+def check_git_identity() -> bool:
+    """Verify the git user identity is configured
+
+    Fails fast with the setup instructions before any staging work
+    instead of discovering the problem from a failed commit. Probes at
+    most once per session after the identity checks out.
+    """
+    global _identity_ok
+    if not _identity_ok:
+        success, output = run_command(['git', 'config', '--get-regexp', r'^user\.(name|email)$'])
+        found = set()
+        if success:
+            for line in output.splitlines():
+                found.add(line.split(' ', 1)[0])
+        _identity_ok = {'user.name', 'user.email'} <= found
+    if not _identity_ok:
+        print_status("error", "Git user not configured. Please run:")
+        print("  git config --global user.email 'you@example.com'")
+        print("  git config --global user.name 'Your Name'")
+    return _identity_ok
+
 def add_and_commit_changes(commit_message: str) -> bool:
-    """Add all changes and commit them"""
-    print_status("info", "Adding and committing changes...")
-    
-    # Add all changes
-    success, output = run_command(['git', 'add', '.'])
-    if not success:
-        print_status("error", f"Failed to add files: {output}")
+    """Stage changes and commit them"""
+    if not check_git_identity():
         return False
-    
-    # Check for git user configuration
-    success, output = run_command(['git', 'commit', '-m', commit_message])
-    
+
+    print_status("info", "Adding and committing changes...")
+
+    # Untracked files come from the already-parsed status, so git gets
+    # an explicit list instead of 'git add .' re-scanning the worktree;
+    # 'commit -a' picks up tracked modifications and deletions without
+    # a separate add process at all. The list is chunked so a huge
+    # batch of new files can't blow past the platform's argv limit.
+    state = get_repo_state()
+    for start in range(0, len(state.new), _ADD_CHUNK):
+        success, output = run_command(
+            ['git', 'add', '--'] + state.new[start:start + _ADD_CHUNK],
+            capture=False
+        )
+        if not success:
+            print_status("error", f"Failed to add files: {output}")
+            return False
+
+    success, output = run_command(['git', 'commit', '-a', '-m', commit_message])
+    invalidate_repo_state()
+
     if success:
         print_status("success", "Changes committed successfully")
         return True
@@ -232,22 +462,22 @@ def add_and_commit_changes(commit_message: str) -> bool:
             print_status("error", f"Failed to commit: {output}")
             return False
 
-def add_remote_origin(repo_url: str) -> bool:
-    """Add remote origin to the repository"""
-    success, output = run_command(['git', 'remote', 'get-url', 'origin'])
-    
-    if success:
-        current_url = output.strip()
-        if current_url == repo_url:
-            print_status("success", "Remote origin already set correctly")
-            return True
-        else:
-            print_status("info", f"Updating remote origin...")
-            success, output = run_command(['git', 'remote', 'set-url', 'origin', repo_url])
+def add_remote_origin(repo_url: str, current_url: Optional[str] = None) -> bool:
+    """Add remote origin to the repository
+
+    current_url comes from detect_repo_info's config read, so no
+    'git remote get-url' subprocess runs just to see what is set.
+    """
+    if current_url == repo_url:
+        print_status("success", "Remote origin already set correctly")
+        return True
+    elif current_url:
+        print_status("info", "Updating remote origin...")
+        success, output = run_command(['git', 'remote', 'set-url', 'origin', repo_url], capture=False)
     else:
         print_status("info", "Adding remote origin...")
-        success, output = run_command(['git', 'remote', 'add', 'origin', repo_url])
-    
+        success, output = run_command(['git', 'remote', 'add', 'origin', repo_url], capture=False)
+
     if success:
         print_status("success", "Remote origin configured")
         return True
@@ -255,8 +485,28 @@ def add_remote_origin(repo_url: str) -> bool:
         print_status("error", f"Failed to configure remote: {output}")
         return False
 
-def push_to_github(branch: str) -> bool:
-    """Push changes to GitHub with smart error handling"""
+# Known push failures as one compiled alternation: a single scan of
+# the output classifies the error via the matching group's name,
+# replacing seven substring searches over a lowercased copy.
+_PUSH_ERR_RE = re.compile(
+    r'(?P<not_found>repository not found|repository does not exist)'
+    r'|(?P<password_removed>support for password authentication was removed)'
+    r'|(?P<auth>permission denied|authentication failed)'
+    r'|(?P<conflict>failed to push|non-fast-forward|rejected)',
+    re.IGNORECASE
+)
+
+def push_to_github(branch: Optional[str] = None) -> bool:
+    """Push changes to GitHub with smart error handling
+
+    The branch is resolved here, right before it is needed: a flow
+    aborted at the commit step never pays for the probe, and by now
+    the refreshed cached state knows the real name even for a
+    repository that was just initialized.
+    """
+    if branch is None:
+        branch = get_current_branch()
+
     print_status("info", f"Pushing to GitHub ({branch} branch)...")
     
     # Show progress
@@ -269,38 +519,49 @@ def push_to_github(branch: str) -> bool:
         print_status("success", "Successfully pushed to GitHub!")
         return True
     else:
-        # Handle common push errors
-        if "remote: Repository not found" in output or "repository does not exist" in output.lower():
+        # Classify the failure with one pass of the compiled alternation
+        match = _PUSH_ERR_RE.search(output)
+        error_kind = match.lastgroup if match else None
+
+        if error_kind == 'not_found':
             print_status("error", "Repository not found. Make sure:")
             print("  1. The repository exists on GitHub")
             print("  2. You have access to the repository")
             print("  3. Your GitHub credentials are configured")
             return False
-        elif "Permission denied" in output or "Authentication failed" in output:
+        elif error_kind == 'auth':
             print_status("error", "Permission denied. Please check your GitHub authentication:")
             print("  1. Generate a personal access token at: https://github.com/settings/tokens")
             print("  2. Use your GitHub username and token as password when prompted")
             return False
-        elif "support for password authentication was removed" in output.lower():
+        elif error_kind == 'password_removed':
             print_status("error", "Password authentication is no longer supported.")
             print("  1. Generate a personal access token: https://github.com/settings/tokens")
             print("  2. Use token as password when Git asks for credentials")
             return False
-        elif any(keyword in output.lower() for keyword in ["failed to push", "rejected", "non-fast-forward"]):
+        elif error_kind == 'conflict':
             # Try to handle push conflicts
             print_status("warning", "Push rejected. Attempting to resolve...")
-            
-            # Try pull with merge
-            print_status("info", "Trying to pull and merge remote changes...")
-            success, pull_output = run_command(['git', 'pull', 'origin', branch, '--allow-unrelated-histories'])
-            
+
+            # One ls-remote says whether the branch exists remotely at
+            # all; if it doesn't, pulling from it can only fail, so the
+            # merge attempt (and its network round-trip) is skipped.
+            remote_has_branch = True
+            success, refs = run_command(['git', 'ls-remote', '--heads', 'origin', branch])
             if success:
-                print_status("success", "Successfully merged remote changes")
-                success, push_output = run_command(['git', 'push', '-u', 'origin', branch])
+                remote_has_branch = bool(refs.strip())
+
+            if remote_has_branch:
+                print_status("info", "Trying to pull and merge remote changes...")
+                success, pull_output = run_command(['git', 'pull', 'origin', branch, '--allow-unrelated-histories'])
+
                 if success:
-                    print_status("success", "Successfully pushed after merge!")
-                    return True
-            
+                    print_status("success", "Successfully merged remote changes")
+                    success, push_output = run_command(['git', 'push', '-u', 'origin', branch])
+                    if success:
+                        print_status("success", "Successfully pushed after merge!")
+                        return True
+
             # Ask for force push
             if confirm("Force push (this will overwrite remote repository)?"):
                 success, force_output = run_command(['git', 'push', '--force-with-lease', 'origin', branch])
@@ -321,6 +582,10 @@ def main():
     
     try:
         while True:
+            # Fresh iteration: state cached from the previous push may
+            # be stale
+            invalidate_repo_state()
+
             # Get repository URL
             repo_url = get_input("\nEnter GitHub repository URL (or 'quit' to exit)")
             
@@ -337,8 +602,8 @@ def main():
             print_status("success", f"Repository URL: {parsed_url}")
             
             # Check if git repo exists and show status
-            git_dir = Path.cwd() / '.git'
-            if git_dir.exists():
+            info = detect_repo_info()
+            if info.is_repo:
                 has_changes = display_git_status()
                 if not has_changes:
                     print_status("info", "No changes to push")
@@ -365,17 +630,16 @@ def main():
                 continue
             
             # Execute git operations
-            if not initialize_git_repo():
+            if not initialize_git_repo(info.is_repo):
                 continue
                 
             if not add_and_commit_changes(commit_message):
                 continue
                 
-            if not add_remote_origin(parsed_url):
+            if not add_remote_origin(parsed_url, info.origin_url):
                 continue
-            
-            branch = get_current_branch()
-            if push_to_github(branch):
+
+            if push_to_github():
                 print(f"\n{colored('🎉 Success! Your files have been pushed to GitHub!', Colors.BOLD + Colors.GREEN)}")
             
             # Ask if user wants to continue